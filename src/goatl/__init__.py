@@ -2,28 +2,39 @@
 """The goat logger"""
 
 import sys
-from .core import log
+from .core import log, info, debug, warn, error, critical
 from .data import LogParams, MethodLogParams, ClassLogParams
 from .defaults import DEFAULTS
 
 
-if sys.version_info >= (3, 8):
-    from importlib import metadata as importlib_metadata
-else:
-    import importlib_metadata
-
-
 def get_version() -> str:
+    # importlib.metadata is the slowest part of importing goatl,
+    # so it is only imported once the version is asked for
+    if sys.version_info >= (3, 8):
+        from importlib import metadata as importlib_metadata
+    else:
+        import importlib_metadata
+
     try:
         return importlib_metadata.version(__name__)
     except importlib_metadata.PackageNotFoundError:  # pragma: no cover
         return "unknown"
 
 
-version: str = get_version()
+def __getattr__(name: str) -> str:
+    if name == "version":
+        version = globals()["version"] = get_version()
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "log",
+    "info",
+    "debug",
+    "warn",
+    "error",
+    "critical",
     "LogParams",
     "MethodLogParams",
     "ClassLogParams",
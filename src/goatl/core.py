@@ -1,10 +1,11 @@
 import logging
 from typing import (
+    Any,
     Callable,
     Union,
     Optional,
+    Unpack,
 )
-from typing_extensions import Unpack
 
 from .data import (
     P,
@@ -21,6 +22,40 @@ from .helpers import (
     wrap_class,
 )
 
+
+def make_level_log(name: str, level: int) -> Callable[..., Any]:
+    """Build <name>: log a message, wrap a function or make a decorator at level"""
+    wrap_level = LogLevel(level)
+
+    def level_log(
+        f: Union[Optional[Callable[P, R]], str] = None,
+        logger: Optional[Logger] = None,
+        **params: Unpack[MethodLogParams],
+    ) -> Union[Callable[[Callable[P, R]], Callable[P, R]], Callable[P, R], None]:
+        if isinstance(f, str):
+            lg = get_logger(logger)
+            if lg.isEnabledFor(level):
+                lg.log(level, f)
+            return None
+        elif callable(f):
+            return wrap_function(f, logger, level=wrap_level, **params)
+        else:
+            return log.wrap(None, logger=logger, level=wrap_level, **params)
+
+    level_log.__name__ = level_log.__qualname__ = name
+
+    return level_log
+
+
+# the level helpers are plain module functions, log.<level> refers to the same
+# objects, frequent callers can import them and skip the class attribute lookup
+info = make_level_log("info", logging.INFO)
+debug = make_level_log("debug", logging.DEBUG)
+warn = make_level_log("warn", logging.WARN)
+error = make_level_log("error", logging.ERROR)
+critical = make_level_log("critical", logging.CRITICAL)
+
+
 class log:
     @staticmethod
     def wrap(
@@ -65,68 +100,17 @@ class log:
         >>> log.log(logging.INFO, "Test message")
         """
         if isinstance(m, str):
-            get_logger(logger).log(level, m)
+            lg = get_logger(logger)
+            if lg.isEnabledFor(level):
+                lg.log(level, m)
             return None
         elif callable(m):
             return wrap_function(m, logger, level=level, **params)
         else:
             return log.wrap(None, logger=logger, level=level, **params)
 
-    @staticmethod
-    def info(
-        f: Union[Optional[Callable[P, R]], str] = None,
-        logger: Optional[Logger] = None,
-        **params: Unpack[MethodLogParams],
-    ) -> Union[Callable[[Callable[P, R]], Callable[P, R]], Callable[P, R], None]:
-        return log.log(logging.INFO, f, logger, **params)
-
-    @staticmethod
-    def debug(
-        f: Union[Optional[Callable[P, R]], str] = None,
-        logger: Optional[Logger] = None,
-        **params: Unpack[MethodLogParams],
-    ) -> Union[Callable[[Callable[P, R]], Callable[P, R]], Callable[P, R], None]:
-        return log.log(logging.DEBUG, f, logger, **params)
-
-    @staticmethod
-    def warn(
-        f: Union[Optional[Callable[P, R]], str] = None,
-        logger: Optional[Logger] = None,
-        **params: Unpack[MethodLogParams],
-    ) -> Union[Callable[[Callable[P, R]], Callable[P, R]], Callable[P, R], None]:
-        if isinstance(f, str):
-            log.log(logging.WARN, f, logger)
-            return None
-        elif callable(f):
-            return wrap_function(f, logger, level=logging.WARN, **params)
-        else:
-            return log.wrap(None, logger=logger, level=logging.WARN, **params)
-
-    @staticmethod
-    def error(
-        f: Union[Optional[Callable[P, R]], str] = None,
-        logger: Optional[Logger] = None,
-        **params: Unpack[MethodLogParams],
-    ) -> Union[Callable[[Callable[P, R]], Callable[P, R]], Callable[P, R], None]:
-        if isinstance(f, str):
-            return log.log(logging.ERROR, f, logger)
-        elif callable(f):
-            return wrap_function(f, logger, level=logging.ERROR, **params)
-        else:
-            return log.wrap(None, logger=logger, level=logging.ERROR, **params)
-
-    @staticmethod
-    def critical(
-        f: Union[Optional[Callable[P, R]], str] = None,
-        logger: Optional[Logger] = None,
-        **params: Unpack[MethodLogParams],
-    ) -> Union[Callable[[Callable[P, R]], Callable[P, R]], Callable[P, R], None]:
-        if isinstance(f, str):
-            return log.log(logging.CRITICAL, f, logger)
-        elif callable(f):
-            return wrap_function(f, logger, level=logging.CRITICAL, **params)
-        else:
-            return log.wrap(None, logger=logger, level=logging.CRITICAL, **params)
-
-    
-    
\ No newline at end of file
+    info = staticmethod(info)
+    debug = staticmethod(debug)
+    warn = staticmethod(warn)
+    error = staticmethod(error)
+    critical = staticmethod(critical)
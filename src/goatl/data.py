@@ -6,9 +6,9 @@ from typing import (
     TypedDict,
     NamedTuple,
     Type,
-    Any
+    Any,
+    ParamSpec,
 )
-from typing_extensions import ParamSpec
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -21,6 +21,8 @@ Logger = Union[logging.Logger, str]
 class LogLevel(int):
     "logging.(DEBUG|INFO|WARN|ERROR|CRITICAL)"
 
+    __slots__ = ()
+
 
 class LogParams(NamedTuple):
     """Parameters for logging"""
@@ -38,6 +40,7 @@ class MethodLogParams(TypedDict, total=False):
 
 class ClassLogParams(TypedDict, total=False):
     """Parameter specification for logging a class"""
-    log_init: Optional[Union[LogParams, bool]]
+    log_init: Optional[Union[LogParams, bool, int]]
     log_methods: Optional[Union[MethodLogParams, bool, LogLevel]]
     log_prvt_mthd: Optional[Union[MethodLogParams, bool, LogLevel]]
+    log_dunders: bool
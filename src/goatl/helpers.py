@@ -1,12 +1,21 @@
 import logging
-from functools import wraps
+from functools import lru_cache
+from string import Formatter
 from types import FunctionType
 from typing import (
+    Any,
     Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    NamedTuple,
     Union,
     Optional,
+    Tuple,
+    Unpack,
+    cast,
 )
-from typing_extensions import Unpack
 
 from .data import (
     P,
@@ -20,16 +29,177 @@ from .data import (
 from .defaults import DEFAULTS
 
 
+# inspect.CO_VARARGS | inspect.CO_VARKEYWORDS, without importing inspect
+CO_VARARGS_OR_VARKEYWORDS = 0x04 | 0x08
+
+Emitter = Callable[[Dict[str, Any]], None]
+
+
+class BraceMessage:
+    """A str.format style message, formatted only when a handler emits it"""
+
+    __slots__ = ("fmt", "kwargs", "_msg")
+
+    def __init__(self, fmt: str, kwargs: Mapping[str, Any]) -> None:
+        self.fmt = fmt
+        self.kwargs = kwargs
+        self._msg: Optional[str] = None
+
+    def __str__(self) -> str:
+        # every handler/formatter asks the record for its message again
+        if self._msg is None:
+            self._msg = self.fmt.format_map(self.kwargs)
+        return self._msg
+
+
+DEFAULT_LOGGER = logging.getLogger(__name__)
+
+
+# names map to the same logger for the life of the process, caching them
+# spares logging.getLogger's module lock on every repeated lookup
+get_named_logger = lru_cache(maxsize=None)(logging.getLogger)
+
 
 def get_logger(logger: Optional[Logger]) -> logging.Logger:
     if isinstance(logger, logging.Logger):
-        pass
+        return logger
     elif isinstance(logger, str):
-        logger = logging.getLogger(logger)
+        return get_named_logger(logger)
+
+    # None, and anything else passed in by mistake
+    return DEFAULT_LOGGER
+
+
+# fields always holding a str, tuple or dict, for which format(value, "")
+# and %s agree; anything else (the result) may define its own __format__
+PERCENT_SAFE_FIELDS = frozenset({"funcName", "args", "kwargs"})
+
+# the default return template renders its result with %s, keeping the default
+# records on the %-path; custom templates keep str.format's __format__ call
+DEFAULT_RETURN_FIELDS = PERCENT_SAFE_FIELDS | {"result"}
+
+
+# the same few templates come back for every decorated function
+@lru_cache(maxsize=256)
+def to_percent_style(
+    msg: str, safe_fields: FrozenSet[str] = PERCENT_SAFE_FIELDS
+) -> Optional[str]:
+    """Translate a str.format template using only plain {name} fields to %(name)s"""
+    parts = []
+    try:
+        for literal, field, spec, conversion in Formatter().parse(msg):
+            parts.append(literal.replace("%", "%%"))
+            if field is None:
+                continue
+            if not field.isidentifier() or spec:
+                return None
+            # without !s/!r/!a str.format calls the value's __format__
+            if not conversion and field not in safe_fields:
+                return None
+            parts.append(f"%({field}){conversion or 's'}")
+    except ValueError:
+        return None
+
+    return "".join(parts)
+
+
+def get_emitter(lg: logging.Logger, level: int, msg: str) -> Emitter:
+    """Hand a message template to logging so it is only formatted when emitted"""
+    log = lg.log
+
+    # every template is str.format style, those that translate to %-style are
+    # formatted by logging, the rest is left to BraceMessage
+    if msg == DEFAULTS.RETURN_MSG:
+        percent_msg = to_percent_style(msg, DEFAULT_RETURN_FIELDS)
     else:
-        logger = logging.getLogger(__name__)
+        percent_msg = to_percent_style(msg)
+
+    if percent_msg is not None:
+
+        def emit(fields: Dict[str, Any]) -> None:
+            log(level, percent_msg, fields)
+
+    else:
+
+        def emit(fields: Dict[str, Any]) -> None:
+            log(level, BraceMessage(msg, fields))
+
+    return emit
+
+
+def takes_no_arguments(f: Callable[..., Any]) -> bool:
+    code = getattr(f, "__code__", None)
+    return (
+        code is not None
+        and code.co_argcount == 0
+        and code.co_kwonlyargcount == 0
+        and not code.co_flags & CO_VARARGS_OR_VARKEYWORDS
+    )
+
+
+def wrap_no_arguments(
+    f: Callable[[], R],
+    lg: logging.Logger,
+    call_emit: Optional[Emitter],
+    call_level: int,
+    return_emit: Optional[Emitter],
+    return_level: int,
+) -> Callable[[], R]:
+    """Same as the wrappers in wrap_function, without packing *args/**kwargs"""
+    funcName = f.__name__
+    is_enabled = lg.isEnabledFor
+
+    if call_emit is not None and return_emit is not None:
+
+        def wrapper() -> R:
+            if is_enabled(call_level):
+                call_emit({"funcName": funcName, "args": (), "kwargs": {}})
+            result = f()
+            if is_enabled(return_level):
+                return_emit({"funcName": funcName, "result": result})
+            return result
+
+    elif call_emit is not None:
+
+        def wrapper() -> R:
+            if is_enabled(call_level):
+                call_emit({"funcName": funcName, "args": (), "kwargs": {}})
+            return f()
 
-    return logger
+    elif return_emit is not None:
+
+        def wrapper() -> R:
+            result = f()
+            if is_enabled(return_level):
+                return_emit({"funcName": funcName, "result": result})
+            return result
+
+    else:
+
+        def wrapper() -> R:
+            return f()
+
+    return wrapper
+
+
+class ResolvedMethodLogParams(NamedTuple):
+    """MethodLogParams with the defaults filled in, in make_wrapper order"""
+    call_msg: Optional[str]
+    call_level: Optional[int]
+    return_msg: Optional[str]
+    return_level: Optional[int]
+
+
+def resolve_method_log_params(
+    params: MethodLogParams, level: Optional[LogLevel] = None
+) -> ResolvedMethodLogParams:
+    """Fill in the defaults for the keys missing from params"""
+    return ResolvedMethodLogParams(
+        params.get("call_msg", DEFAULTS.CALL_MSG),
+        params.get("call_level", level or DEFAULTS.CALL_LEVEL),
+        params.get("return_msg", DEFAULTS.RETURN_MSG),
+        params.get("return_level", level or DEFAULTS.RETURN_LEVEL),
+    )
 
 
 def wrap_function(
@@ -38,128 +208,239 @@ def wrap_function(
     level: Optional[LogLevel] = None,
     **params: Unpack[MethodLogParams],
 ) -> Callable[P, R]:
-    if getattr(f, "__log_wrapped__", False):
+    # resolve the logger once, not on every call
+    return make_wrapper(
+        f, get_logger(logger), *resolve_method_log_params(params, level)
+    )
+
+
+def make_wrapper(
+    f: Callable[P, R],
+    lg: logging.Logger,
+    call_msg: Optional[str],
+    call_level: Optional[int],
+    return_msg: Optional[str],
+    return_level: Optional[int],
+) -> Callable[P, R]:
+    """wrap_function with the logger and parameters already resolved"""
+    # read the marker straight from the function's namespace,
+    # callables without one can't carry it
+    f_dict = getattr(f, "__dict__", None)
+    if f_dict is not None and f_dict.get("__log_wrapped__", False):
         return f
 
     funcName = f.__name__
+    is_enabled = lg.isEnabledFor
+
+    call_emit = (
+        get_emitter(lg, call_level, call_msg)
+        if call_msg is not None and call_level is not None
+        else None
+    )
+    return_emit = (
+        get_emitter(lg, return_level, return_msg)
+        if return_msg is not None and return_level is not None
+        else None
+    )
+    # a level is only read by wrappers that emit on that side, where it is set
+    call_at = call_level or logging.NOTSET
+    return_at = return_level or logging.NOTSET
+
+    # the configuration is fixed from here on, so pick a wrapper that only
+    # does what it needs to instead of branching on every call
+    # levels are checked before formatting, a filtered record costs nothing
+    if takes_no_arguments(f):
+        wrapper = cast(
+            Callable[P, R],
+            wrap_no_arguments(
+                cast(Callable[[], R], f),
+                lg,
+                call_emit,
+                call_at,
+                return_emit,
+                return_at,
+            ),
+        )
+
+    elif call_emit is not None and return_emit is not None:
 
-    call_msg = params.get("call_msg", DEFAULTS.CALL_MSG)
-    call_level = params.get("call_level", level or DEFAULTS.CALL_LEVEL)
-    return_msg = params.get("return_msg", DEFAULTS.RETURN_MSG)
-    return_level = params.get("return_level", level or DEFAULTS.RETURN_LEVEL)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if is_enabled(call_at):
+                call_emit({"funcName": funcName, "args": args, "kwargs": kwargs})
+            result = f(*args, **kwargs)
+            if is_enabled(return_at):
+                return_emit({"funcName": funcName, "result": result})
+            return result
 
-    @wraps(f)
-    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-        if call_msg is not None and call_level is not None:
-            get_logger(logger).log(
-                call_level, call_msg.format(funcName=funcName, args=args, kwargs=kwargs)
-            )
+    elif call_emit is not None:
 
-        result = f(*args, **kwargs)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            if is_enabled(call_at):
+                call_emit({"funcName": funcName, "args": args, "kwargs": kwargs})
+            return f(*args, **kwargs)
 
-        if return_msg is not None and return_level is not None:
-            get_logger(logger).log(
-                return_level, return_msg.format(funcName=funcName, result=result)
-            )
+    elif return_emit is not None:
 
-        return result
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            result = f(*args, **kwargs)
+            if is_enabled(return_at):
+                return_emit({"funcName": funcName, "result": result})
+            return result
 
-    setattr(wrapper, "__log_wrapped__", True)
+    else:
+
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            return f(*args, **kwargs)
+
+    # copy only the metadata logging and introspection rely on, unlike
+    # functools.wraps this skips __annotations__ and merging f's __dict__
+    wrapper.__name__ = funcName
+    wrapper.__qualname__ = getattr(f, "__qualname__", funcName)
+    wrapper.__doc__ = getattr(f, "__doc__", None)
+    wrapper.__module__ = getattr(f, "__module__", wrapper.__module__)
+    wrapper.__dict__["__wrapped__"] = f
+    wrapper.__dict__["__log_wrapped__"] = True
 
     return wrapper
 
 
+MethodLogParamsHandler = Callable[[Any, bool], Optional[MethodLogParams]]
+
+# keyed on the exact type, bool has to be found before it is mistaken for a level
+METHOD_LOG_PARAMS_BY_TYPE: Dict[type, MethodLogParamsHandler] = {
+    type(None): lambda p, none_is_true: MethodLogParams() if none_is_true else None,
+    bool: lambda p, none_is_true: MethodLogParams() if p else None,
+    int: lambda p, none_is_true: MethodLogParams(call_level=p, return_level=p),
+    dict: lambda p, none_is_true: p,
+}
+
+
 def get_method_log_params(
     p: Optional[Union[MethodLogParams, bool, LogLevel]], none_is_true: bool = False
 ) -> Optional[MethodLogParams]:
-    if p is None:
-        if none_is_true:
-            return MethodLogParams()
-        else:
-            return None
-    elif p is True:
-        return MethodLogParams()
+    handler = METHOD_LOG_PARAMS_BY_TYPE.get(type(p))
+    if handler is not None:
+        return handler(p, none_is_true)
     elif isinstance(p, int):
         return MethodLogParams(call_level=p, return_level=p)
     else:
         return p
 
 
+# dunders called by containers, comparisons and attribute access,
+# wrapping them costs every dict lookup or print, so they are opt-in
+HOT_DUNDERS = frozenset(
+    {
+        "__hash__",
+        "__eq__",
+        "__lt__",
+        "__le__",
+        "__gt__",
+        "__ge__",
+        "__repr__",
+        "__str__",
+        "__iter__",
+        "__next__",
+        "__getitem__",
+        "__setitem__",
+        "__len__",
+        "__contains__",
+        "__bool__",
+        "__call__",
+        "__getattr__",
+        "__getattribute__",
+        "__setattr__",
+    }
+)
+
+# the call record formats its args with %s/!r, so wrapping these would
+# have them log (and format) themselves again, even with log_dunders
+SELF_FORMATTING_DUNDERS = frozenset({"__repr__", "__str__", "__format__"})
+
+
 def wrap_class(
     cls: C,
     /,
     level: Optional[LogLevel] = None,
     logger: Optional[Logger] = None,
-    log_init: Optional[Union[LogParams, bool, LogLevel]] = None,
+    log_init: Optional[Union[LogParams, bool, int]] = None,
     log_methods: Optional[Union[MethodLogParams, bool, LogLevel]] = None,
     log_prvt_mthd: Optional[Union[MethodLogParams, bool, LogLevel]] = None,
+    log_dunders: bool = False,
 ) -> C:
+    # log_methods=None means the defaults, only an explicit False turns it off
+    if log_init is False and log_methods is False and not log_prvt_mthd:
+        DEFAULT_LOGGER.debug("nothing to log for %s, leaving it as is", cls.__name__)
+        return cls
+
     log_methods = get_method_log_params(log_methods, none_is_true=True)
     log_prvt_mthd = get_method_log_params(log_prvt_mthd)
-    for name, value in cls.__dict__.items():
-        if log_methods and isinstance(value, classmethod):
-            setattr(
-                cls,
-                name,
-                classmethod(
-                    wrap_function(
-                        value.__func__, level=level, logger=logger, **log_methods
-                    )
-                ),
-            )
-        elif log_methods and isinstance(value, staticmethod):
-            setattr(
-                cls,
-                name,
-                staticmethod(
-                    wrap_function(
-                        value.__func__, level=level, logger=logger, **log_methods
-                    )
-                ),
-            )
-
-        if not isinstance(value, FunctionType):
-            continue
 
-        if name == "__init__":
-            if log_init is False:
-                continue
-            elif log_init is None or log_init is True:
-                log_init = LogParams(DEFAULTS.INIT_MSG, DEFAULTS.INIT_LEVEL, logger)
-            elif isinstance(log_init, LogLevel):
-                log_init = LogParams(DEFAULTS.INIT_MSG, log_init, logger)
-
-            setattr(
-                cls,
-                name,
-                wrap_function(
-                    value,
-                    level=log_init.level or level,
-                    call_msg=log_init.msg,
-                    logger=logger,
-                    return_msg=None,
-                ),
-            )
+    # resolve the logger and every set of parameters once for the whole class
+    lg = get_logger(logger)
+    method_params = (
+        resolve_method_log_params(log_methods, level)
+        if log_methods is not None
+        else None
+    )
+    # log_prvt_mthd=True resolves to an empty, falsy, MethodLogParams
+    prvt_params = (
+        resolve_method_log_params(log_prvt_mthd, level)
+        if log_prvt_mthd is not None
+        else None
+    )
+    init_params = None
+    if log_init is not False:
+        if log_init is None or log_init is True:
+            log_init = LogParams(DEFAULTS.INIT_MSG, DEFAULTS.INIT_LEVEL, logger)
+        elif isinstance(log_init, int):
+            # plain logging.DEBUG etc. count as levels, like in get_method_log_params
+            log_init = LogParams(DEFAULTS.INIT_MSG, LogLevel(log_init), logger)
+        init_params = resolve_method_log_params(
+            MethodLogParams(call_msg=log_init.msg, return_msg=None),
+            log_init.level or level,
+        )
+
+    # decide on every replacement first and only then touch the class,
+    # the namespace is never mutated while it is being walked
+    # class variables, nested types and the like are filtered out up front
+    types_of_interest: Tuple[type, ...] = (FunctionType,)
+    if log_methods:
+        types_of_interest += (classmethod, staticmethod)
+    members: List[Tuple[str, Any]] = [
+        (name, value)
+        for name, value in cls.__dict__.items()
+        if isinstance(value, types_of_interest)
+    ]
+
+    replacements: Dict[str, Any] = {}
+    # wrapping a class again only adds what the earlier options left out,
+    # already wrapped functions keep their slot, no setattr needed
+    for name, value in members:
+        underlying = getattr(value, "__func__", value)
+        if getattr(underlying, "__dict__", {}).get("__log_wrapped__", False):
             continue
-        elif log_prvt_mthd and name.startswith("_"):
-            setattr(
-                cls,
-                name,
-                wrap_function(
-                    value,
-                    logger=logger,
-                    level=level,
-                    **log_prvt_mthd,
-                ),
-            )
+
+        if isinstance(value, (classmethod, staticmethod)):
+            # only collected when log_methods is set, so method_params is too
+            if method_params is not None:
+                replacements[name] = type(value)(
+                    make_wrapper(value.__func__, lg, *method_params)
+                )
+        elif name == "__init__":
+            if init_params is not None:
+                replacements[name] = make_wrapper(value, lg, *init_params)
+        elif name in SELF_FORMATTING_DUNDERS:
             continue
-        elif log_methods is None:
+        elif prvt_params is not None and name.startswith("_"):
+            # an explicit log_prvt_mthd covers the hot dunders as well
+            replacements[name] = make_wrapper(value, lg, *prvt_params)
+        elif name in HOT_DUNDERS and not log_dunders:
             continue
+        elif method_params is not None:
+            replacements[name] = make_wrapper(value, lg, *method_params)
 
-        setattr(
-            cls,
-            name,
-            wrap_function(value, level=level, logger=logger, **log_methods),
-        )
+    for name, value in replacements.items():
+        setattr(cls, name, value)
 
     return cls
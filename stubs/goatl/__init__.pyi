@@ -1,4 +1,4 @@
-from .core import log as log
+from .core import log as log, info as info, debug as debug, warn as warn, error as error, critical as critical
 from .data import ClassLogParams as ClassLogParams, LogParams as LogParams, MethodLogParams as MethodLogParams
 from .defaults import DEFAULTS as DEFAULTS
 
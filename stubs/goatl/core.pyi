@@ -8,8 +8,40 @@ from .data import (
     ClassLogParams,
 )
 
-from typing import Callable, Optional, Union, overload
-from typing_extensions import Unpack
+from typing import Any, Callable, Optional, Union, Unpack, overload
+
+def make_level_log(name: str, level: int) -> Callable[..., Any]: ...
+
+@overload
+def info(f: str, logger: Optional[Logger] = ...) -> None: ...
+@overload
+def info(f: Callable[P, R]) -> Callable[P, R]: ...
+@overload
+def info(f: None = ..., logger: Optional[Logger] = ..., **params: Unpack[MethodLogParams]) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
+@overload
+def debug(f: str, logger: Optional[Logger] = ...) -> None: ...
+@overload
+def debug(f: Callable[P, R]) -> Callable[P, R]: ...
+@overload
+def debug(f: None = ..., logger: Optional[Logger] = ..., **params: Unpack[MethodLogParams]) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
+@overload
+def warn(f: str, logger: Optional[Logger] = ...) -> None: ...
+@overload
+def warn(f: Callable[P, R]) -> Callable[P, R]: ...
+@overload
+def warn(f: None = ..., logger: Optional[Logger] = ..., **params: Unpack[MethodLogParams]) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
+@overload
+def error(f: str, logger: Optional[Logger] = ...) -> None: ...
+@overload
+def error(f: Callable[P, R]) -> Callable[P, R]: ...
+@overload
+def error(f: None = ..., logger: Optional[Logger] = ..., **params: Unpack[MethodLogParams]) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
+@overload
+def critical(f: str, logger: Optional[Logger] = ...) -> None: ...
+@overload
+def critical(f: Callable[P, R]) -> Callable[P, R]: ...
+@overload
+def critical(f: None = ..., logger: Optional[Logger] = ..., **params: Unpack[MethodLogParams]) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
 
 class log:
     @overload
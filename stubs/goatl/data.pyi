@@ -1,6 +1,5 @@
 import logging
-from typing import Any, NamedTuple, Optional, Type, TypeVar, TypedDict, Union
-from typing_extensions import ParamSpec
+from typing import Any, NamedTuple, Optional, ParamSpec, Type, TypeVar, TypedDict, Union
 
 P = ParamSpec('P')
 R = TypeVar('R')
@@ -20,7 +19,8 @@ class MethodLogParams(TypedDict, total=False):
     return_level: Optional[LogLevel]
 
 class ClassLogParams(TypedDict, total=False):
-    log_init: Optional[Union[LogParams, bool]]
+    log_init: Optional[Union[LogParams, bool, int]]
     log_methods: Optional[Union[MethodLogParams, bool, LogLevel]]
     log_prvt_mthd: Optional[Union[MethodLogParams, bool, LogLevel]]
+    log_dunders: bool
 
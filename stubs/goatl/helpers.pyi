@@ -1,10 +1,44 @@
 import logging
 from .data import P, R, C, Logger, LogLevel, MethodLogParams, LogParams
 from .defaults import DEFAULTS as DEFAULTS
-from typing import Callable, Optional, Union
-from typing_extensions import Unpack
+from typing import Any, Callable, Dict, FrozenSet, Mapping, NamedTuple, Optional, Union, Unpack
 
+CO_VARARGS_OR_VARKEYWORDS: int
+Emitter = Callable[[Dict[str, Any]], None]
+
+class BraceMessage:
+    fmt: str
+    kwargs: Mapping[str, Any]
+    def __init__(self, fmt: str, kwargs: Mapping[str, Any]) -> None: ...
+    def __str__(self) -> str: ...
+
+DEFAULT_LOGGER: logging.Logger
+
+def get_named_logger(name: str) -> logging.Logger: ...
 def get_logger(logger: Optional[Logger]) -> logging.Logger: ...
+
+PERCENT_SAFE_FIELDS: FrozenSet[str]
+DEFAULT_RETURN_FIELDS: FrozenSet[str]
+
+def to_percent_style(msg: str, safe_fields: FrozenSet[str] = ...) -> Optional[str]: ...
+def get_emitter(lg: logging.Logger, level: int, msg: str) -> Emitter: ...
+def takes_no_arguments(f: Callable[..., Any]) -> bool: ...
+def wrap_no_arguments(f: Callable[[], R], lg: logging.Logger, call_emit: Optional[Emitter], call_level: int, return_emit: Optional[Emitter], return_level: int) -> Callable[[], R]: ...
+class ResolvedMethodLogParams(NamedTuple):
+    call_msg: Optional[str]
+    call_level: Optional[int]
+    return_msg: Optional[str]
+    return_level: Optional[int]
+
+def resolve_method_log_params(params: MethodLogParams, level: Optional[LogLevel] = ...) -> ResolvedMethodLogParams: ...
 def wrap_function(f: Callable[P, R], logger: Optional[Logger] = ..., level: Optional[LogLevel] = ..., **params: Unpack[MethodLogParams]) -> Callable[P, R]: ...
+def make_wrapper(f: Callable[P, R], lg: logging.Logger, call_msg: Optional[str], call_level: Optional[int], return_msg: Optional[str], return_level: Optional[int]) -> Callable[P, R]: ...
+MethodLogParamsHandler = Callable[[Any, bool], Optional[MethodLogParams]]
+METHOD_LOG_PARAMS_BY_TYPE: Dict[type, MethodLogParamsHandler]
+
 def get_method_log_params(p: Optional[Union[MethodLogParams, bool, LogLevel]], none_is_true: bool = ...) -> Optional[MethodLogParams]: ...
-def wrap_class(cls: C, level: Optional[LogLevel] = ..., logger: Optional[Logger] = ..., log_init: Optional[Union[LogParams, bool, LogLevel]] = ..., log_methods: Optional[Union[MethodLogParams, bool, LogLevel]] = ..., log_prvt_mthd: Optional[Union[MethodLogParams, bool, LogLevel]] = ...) -> C: ...
+
+HOT_DUNDERS: FrozenSet[str]
+SELF_FORMATTING_DUNDERS: FrozenSet[str]
+
+def wrap_class(cls: C, level: Optional[LogLevel] = ..., logger: Optional[Logger] = ..., log_init: Optional[Union[LogParams, bool, int]] = ..., log_methods: Optional[Union[MethodLogParams, bool, LogLevel]] = ..., log_prvt_mthd: Optional[Union[MethodLogParams, bool, LogLevel]] = ..., log_dunders: bool = ...) -> C: ...
@@ -1,5 +1,6 @@
 import pytest
 import logging
+import goatl
 from goatl import log
 
 def test_wrap():
@@ -26,6 +27,19 @@ def test_wrap_class():
     result = instance.method()
     assert result == "Hello, World!", "methods of wrapped class should correctly execute original methods"
 
+def test_wrap_class_binds_class_level_wrappers():
+    class TestClass:
+        def method(self):
+            return "Hello, World!"
+
+    wrapped_class = log.wrap_class(TestClass)
+    wrapped_method = wrapped_class.__dict__["method"]
+
+    instance = wrapped_class()
+    assert instance.method.__func__ is wrapped_method, "methods should be wrapped once on the class"
+    assert "method" not in vars(instance), "instances should not hold re-wrapped methods"
+    assert wrapped_class().method.__func__ is instance.method.__func__, "instances should share wrappers"
+
 def test_log():
     # Assuming log.log returns a callable when passed a function
     def test_func(x):
@@ -41,4 +55,33 @@ def test_log():
     result = log.log(logging.INFO, "Test message")
     assert result is None, "log.log should return None when passed a string"
 
-# Repeat the test_log function for info, debug, warn, error, and critical
\ No newline at end of file
+# Repeat the test_log function for info, debug, warn, error, and critical
+@pytest.mark.parametrize(
+    "method, level",
+    [
+        (log.info, logging.INFO),
+        (log.debug, logging.DEBUG),
+        (log.warn, logging.WARN),
+        (log.error, logging.ERROR),
+        (log.critical, logging.CRITICAL),
+    ],
+)
+def test_log_levels(caplog, method, level):
+    def test_func(x):
+        return x * 2
+
+    with caplog.at_level(logging.DEBUG):
+        assert method("Test message") is None, "level methods should return None when passed a string"
+        assert method(test_func)(5) == 10, "logged function should correctly execute original function"
+        assert method()(test_func)(5) == 10, "level methods should work as decorator factories"
+
+    assert caplog.records[0].getMessage() == "Test message"
+    assert all(record.levelno == level for record in caplog.records)
+
+def test_module_level_helpers():
+    assert goatl.info is log.info, "goatl.info should be the same helper as log.info"
+    assert goatl.debug is log.debug, "goatl.debug should be the same helper as log.debug"
+    assert goatl.warn is log.warn, "goatl.warn should be the same helper as log.warn"
+    assert goatl.error is log.error, "goatl.error should be the same helper as log.error"
+    assert goatl.critical is log.critical, \
+        "goatl.critical should be the same helper as log.critical"
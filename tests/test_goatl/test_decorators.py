@@ -0,0 +1,348 @@
+import pytest
+import logging
+import goatl
+
+
+# the default logger every wrapper logs to
+_LOGGER_NAME = "goatl.helpers"
+_LEVELS = (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR)
+
+
+@pytest.fixture(scope="session")
+def simple_func():
+
+    def inner():
+        return None
+
+    return {"func": inner,
+            "return_value": None,
+            "print_something": ''}
+
+
+@pytest.fixture(params=[(None, ''), (1, ''), (0, ''),
+                        (None, "something"), (1, "something"), (0, "something")])
+def func(request):
+    return_value, print_something = request.param
+
+    def inner():
+        if print_something:
+            print(print_something)
+        return return_value
+
+    return {"func": inner,
+            "return_value": return_value,
+            "print_something": print_something}
+
+
+def _echo_args(*args):
+    return args
+
+
+def _echo_kwargs(**kwargs):
+    return kwargs
+
+
+@pytest.fixture(scope="session", params=[(None), (1), (0)])
+def args_func(request):
+    return {"func": _echo_args,
+            "args": request.param}
+
+
+@pytest.fixture(scope="session", params=[{"a": 1}, {"a": 1, "b": 2}])
+def kwargs_func(request):
+    return {"func": _echo_kwargs,
+            "kwargs": request.param}
+
+
+@pytest.fixture
+def captured_prints(monkeypatch):
+    """Collect print() output without redirecting sys.stdout"""
+    captured = []
+    monkeypatch.setattr("builtins.print",
+                        lambda *args, **kwargs: captured.append(" ".join(map(str, args))))
+    return captured
+
+
+class DummyClass:
+    pass
+
+
+@pytest.fixture
+def decorated_class(func):
+
+    @goatl.log.wrap_class
+    class Class(DummyClass):
+        def func(self):
+            return func["func"]()
+
+    return Class
+
+
+@pytest.fixture(scope="session", params=_LEVELS)
+def level(request):
+    return request.param
+
+
+class TestFuncLogDecorator:
+
+    @pytest.mark.parametrize("make_decorator", [
+        pytest.param(lambda: goatl.log.wrap, id="no_paren"),
+        pytest.param(lambda: goatl.log.wrap(), id="with_paren"),
+    ])
+    def test_log_decoration(self, make_decorator):
+        """Test that the log decorator works."""
+        decorate = make_decorator()
+
+        @decorate
+        def func():
+            pass
+
+        func()
+
+        assert func.__name__ == "func"
+        assert func.__module__ == __name__
+
+    @pytest.mark.parametrize("return_value", [None, 1, 0])
+    @pytest.mark.parametrize("print_something", ['', "something"])
+    def test_log_doesnt_meddle_func(self, return_value, print_something, captured_prints):
+        """Test that the log decorator doesn't meddle with the function."""
+
+        @goatl.log.wrap
+        def inner_func():
+            if print_something:
+                print(print_something)
+            return return_value
+
+        assert inner_func() is return_value
+
+        assert "".join(captured_prints) == print_something
+
+    def test_log_doesnt_meddle_arg_func(self, args_func):
+        """Test that the log decorator doesn't meddle with the function."""
+
+        inner_func = goatl.log.wrap(args_func["func"])
+
+        assert inner_func(args_func["args"]) == (args_func["args"],)
+
+    def test_log_desont_meddle_kwargs_func(self, kwargs_func):
+        """Test that the log decorator doesn't meddle with the function."""
+
+        inner_func = goatl.log.wrap(kwargs_func["func"])
+
+        assert inner_func(**kwargs_func["kwargs"]) == kwargs_func["kwargs"]
+
+    def test_log_doesnt_meddle_generator_func(self):
+        """Test that the log decorator doesn't meddle with the function."""
+
+        @goatl.log.wrap
+        def inner_func():
+            yield 1
+            yield 2
+
+        assert list(inner_func()) == [1, 2]
+
+    def test_log_loggings(self, simple_func, caplog):
+        """Test that the log decorator logs the correct messages."""
+        @goatl.log.wrap
+        def inner_func():
+            return simple_func["func"]()
+
+
+        with caplog.at_level(logging.DEBUG, logger=_LOGGER_NAME):
+            inner_func()
+            assert caplog.records[0].message == "Calling inner_func with () and {}"
+            assert caplog.records[0].name == _LOGGER_NAME
+            assert caplog.records[0].levelno == logging.INFO
+            assert caplog.records[1].message == "Returned %s" % simple_func["return_value"]
+            assert caplog.records[1].levelno == logging.DEBUG
+
+
+    def test_log_all_logs_go_to_level(self, caplog, level):
+
+        @goatl.log.wrap(level=level)
+        def func():
+            pass
+
+        with caplog.at_level(level, logger=_LOGGER_NAME):
+            func()
+
+            assert len(caplog.records) == 2
+            for record in caplog.records:
+                assert record.levelno == level
+
+    def test_log_custom_logger(self, caplog):
+
+        @goatl.log.wrap(logger="custom_logger")
+        def func():
+            pass
+
+        with caplog.at_level(logging.DEBUG, logger="custom_logger"):
+            func()
+
+            for record in caplog.records:
+                assert record.name == "custom_logger"
+
+
+class TestClassLogDecorator:
+    @pytest.mark.parametrize("make_decorator", [
+        pytest.param(lambda: goatl.log.wrap_class, id="no_paren"),
+        pytest.param(lambda: goatl.log.wrap_class(), id="with_paren"),
+    ])
+    def test_log_decoration(self, make_decorator, caplog):
+        """Test that the log decorator works."""
+        decorate = make_decorator()
+
+        with caplog.at_level(logging.DEBUG, logger=_LOGGER_NAME):
+            @decorate
+            class Class:
+                pass
+
+        assert Class.__name__ == "Class"
+        assert Class.__module__ == __name__
+
+    def test_log_doesnt_meddle_class(self, decorated_class, func, captured_prints):
+        """Test that the log decorator doesn't meddle with the class."""
+
+        Class = decorated_class
+        instance = Class()
+
+        assert isinstance(instance, Class)
+        assert isinstance(instance, DummyClass)
+
+        assert getattr(instance, "func") is not Class.func
+        assert getattr(instance, "func").__name__ == "func"
+
+        assert instance.func() is func["return_value"]
+
+        assert "".join(captured_prints) == func['print_something']
+
+    def test_log_level_to_members(self, caplog, level):
+
+        @goatl.log.wrap_class(level=level)
+        class Class:
+            def __init__(self):
+                pass
+
+            def func(self):
+                pass
+
+        with caplog.at_level(logging.DEBUG, logger=_LOGGER_NAME):
+            instance = Class()
+            instance.func()
+
+            assert caplog.records[0].message == "Initialized %s" % instance
+            assert caplog.records[1].message == "Calling func with (%s,) and {}" % instance
+            assert caplog.records[2].message == "Returned None"
+
+            # the init record keeps its own default level
+            assert caplog.records[0].levelno == logging.DEBUG
+            for record in caplog.records[1:]:
+                assert record.levelno == level
+
+
+    def test_hot_dunder_no_log(self, caplog):
+        caplog.set_level(logging.DEBUG, logger=_LOGGER_NAME)
+
+        @goatl.log.wrap_class
+        class Class:
+            def __eq__(self, other):
+                return True
+
+            def __str__(self):
+                return "Class"
+
+        instance = Class()
+
+        caplog.clear()
+
+        assert instance == 1
+        str(instance)
+
+        assert len(caplog.records) == 0
+
+    def test_private_method_override_wrap(self, caplog):
+        @goatl.log.wrap_class
+        class Class:
+            def __init__(self):
+                pass
+
+            @goatl.log.wrap
+            def _func(self):
+                pass
+
+
+        with caplog.at_level(logging.DEBUG, logger=_LOGGER_NAME):
+            instance = Class()
+
+            assert caplog.records[0].message == "Initialized %s" % instance
+
+        caplog.clear()
+
+        with caplog.at_level(logging.DEBUG, logger=_LOGGER_NAME):
+            instance._func()
+
+            assert caplog.records[0].message == "Calling _func with (%s,) and {}" % instance
+            assert caplog.records[0].levelno == logging.INFO
+            assert caplog.records[1].message == "Returned None"
+            assert caplog.records[1].levelno == logging.DEBUG
+
+    def test_private_method_override_wrap_at_level(self, caplog, level):
+        @goatl.log.wrap_class
+        class Class:
+            def __init__(self):
+                pass
+
+            @goatl.log.wrap(level=level)
+            def _func(self):
+                pass
+
+
+        with caplog.at_level(logging.DEBUG, logger=_LOGGER_NAME):
+            instance = Class()
+
+            assert caplog.records[0].message == "Initialized %s" % instance
+
+        caplog.clear()
+
+        with caplog.at_level(level, logger=_LOGGER_NAME):
+            instance._func()
+
+            assert caplog.records[0].message == "Calling _func with (%s,) and {}" % instance
+            assert caplog.records[1].message == "Returned None"
+
+            for record in caplog.records:
+                assert record.levelno == level
+
+    def test_custom_logger_over_class(self, caplog):
+
+        @goatl.log.wrap_class(logger="custom_logger")
+        class Class:
+            def func(self):
+                pass
+
+        with caplog.at_level(logging.DEBUG, logger="custom_logger"):
+            instance = Class()
+            instance.func()
+
+            assert caplog.records[0].name == "custom_logger"
+            assert caplog.records[1].name == "custom_logger"
+
+    def test_wrap_class_in_class(self, caplog):
+
+        @goatl.log.wrap_class
+        class Class:
+
+            class InnerClass:
+                pass
+
+            def func(self):
+                return self.InnerClass()
+
+        with caplog.at_level(logging.DEBUG, logger=_LOGGER_NAME):
+            instance = Class()
+            ret = instance.func()
+
+            # nested classes are left as they are
+            assert len(caplog.records) == 2
+            assert caplog.records[0].message == "Calling func with (%s,) and {}" % instance
+            assert caplog.records[1].message == "Returned %s" % ret
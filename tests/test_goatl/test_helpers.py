@@ -1,10 +1,14 @@
 import logging
 import pytest
-from goatl.helpers import get_logger, wrap_function, get_method_log_params, wrap_class
+from goatl.data import LogLevel
+from goatl.defaults import DEFAULTS
+from goatl.helpers import BraceMessage, get_logger, to_percent_style, wrap_function, get_method_log_params, wrap_class
 
 def test_get_logger():
     logger = get_logger(None)
     assert isinstance(logger, logging.Logger), "get_logger should return a logging.Logger instance"
+    assert get_logger("test_get_logger") is logging.getLogger("test_get_logger")
+    assert get_logger({}) is logger, "unexpected input should fall back to the default logger" # type: ignore
 
 def test_wrap_function():
     def test_func(x):
@@ -21,7 +25,12 @@ def test_get_method_log_params():
     result = get_method_log_params(None)
     assert result is None, "get_method_log_params should return None when passed None"
 
-    # Add more tests here based on the expected behavior of get_method_log_params
+    assert get_method_log_params(None, none_is_true=True) == {}
+    assert get_method_log_params(True) == {}
+    assert get_method_log_params(False) is None, "False should disable logging"
+    assert get_method_log_params(logging.WARN) == {"call_level": logging.WARN, "return_level": logging.WARN}
+    assert get_method_log_params(LogLevel(logging.WARN)) == {"call_level": logging.WARN, "return_level": logging.WARN}
+    assert get_method_log_params({"call_msg": "called"}) == {"call_msg": "called"}
 
 def test_wrap_class():
     class TestClass:
@@ -36,3 +45,307 @@ def test_wrap_class():
 
     result = instance.method()
     assert result == "Hello, World!", "methods of wrapped class should correctly execute original methods"
+
+def test_wrap_function_skips_formatting_when_disabled(monkeypatch):
+    emitted = []
+    monkeypatch.setattr(
+        "goatl.helpers.get_emitter", lambda lg, level, msg: emitted.append
+    )
+
+    logger = logging.getLogger("test_wrap_function_disabled")
+    logger.setLevel(logging.WARNING)
+
+    wrapped_func = wrap_function(lambda x: x, logger, level=logging.DEBUG)
+    wrapped_no_args = wrap_function(lambda: None, logger, level=logging.DEBUG)
+
+    assert wrapped_func(1) == 1
+    assert wrapped_no_args() is None
+    assert emitted == [], "disabled levels should not build call or return messages"
+
+def test_wrap_function_messages(caplog):
+    def test_func(x):
+        return x * 2
+
+    wrapped_func = wrap_function(test_func, return_msg="{funcName} gave {result}")
+
+    with caplog.at_level(logging.DEBUG):
+        wrapped_func(5)
+
+    assert caplog.records[0].getMessage() == "Calling test_func with (5,) and {}"
+    assert caplog.records[1].getMessage() == "test_func gave 10"
+
+def test_wrap_class_twice():
+    class TestClass:
+        def method(self):
+            return "Hello, World!"
+
+    wrapped_class = wrap_class(TestClass)
+    method = wrapped_class.__dict__["method"]
+
+    assert wrap_class(wrapped_class) is wrapped_class, "wrap_class should be idempotent"
+    assert wrapped_class.__dict__["method"] is method, "methods should not be re-wrapped"
+
+    class Private:
+        def method(self):
+            return "Hello, World!"
+
+        def _private(self):
+            return "Hello, World!"
+
+    wrap_class(Private, log_init=False, log_methods=False, log_prvt_mthd=True)
+    private = Private.__dict__["_private"]
+    assert not getattr(Private.__dict__["method"], "__log_wrapped__", False)
+    wrap_class(Private, log_init=False)
+    assert getattr(Private.__dict__["method"], "__log_wrapped__", False), \
+        "wrapping again with other options should wrap what was left out"
+    assert Private.__dict__["_private"] is private, \
+        "wrapping again should leave the already wrapped methods alone"
+
+    class Prewrapped:
+        method = wrap_function(lambda self: "Hello, World!")
+        static = staticmethod(wrap_function(lambda: "Hello, World!"))
+
+    static = Prewrapped.__dict__["static"]
+    wrap_class(Prewrapped, log_methods=logging.DEBUG)
+    assert Prewrapped.__dict__["static"] is static, \
+        "already wrapped methods should be left in place"
+
+    # wrap_class returns the class it was given, TestClass is the wrapped one
+    class SubClass(TestClass):
+        def sub_method(self):
+            return "Hello, Sub!"
+
+    wrap_class(SubClass)
+    assert getattr(SubClass.__dict__["sub_method"], "__log_wrapped__", False), \
+        "subclasses of a wrapped class should still be wrapped"
+
+def test_wrap_class_does_not_touch_properties():
+    calls = []
+
+    class TestClass:
+        @property
+        def prop(self):
+            calls.append("prop")
+            return "Hello, World!"
+
+    instance = wrap_class(TestClass)()
+    assert calls == [], "wrapping and instantiating should not evaluate properties"
+    assert instance.prop == "Hello, World!"
+
+def test_wrap_class_skips_hot_dunders(caplog):
+    class TestClass:
+        def __repr__(self):
+            return "TestClass()"
+
+        def __eq__(self, other):
+            return True
+
+    instance = wrap_class(TestClass)()
+    with caplog.at_level(logging.DEBUG):
+        assert repr(instance) == "TestClass()"
+        assert instance == 1
+    assert caplog.records == [], "hot dunders should not be wrapped by default"
+
+    class OptedIn:
+        def __eq__(self, other):
+            return True
+
+    instance = wrap_class(OptedIn, log_init=False, log_dunders=True)()
+    with caplog.at_level(logging.DEBUG):
+        assert instance == 1
+    assert caplog.records[0].getMessage().startswith("Calling __eq__")
+
+def test_wrap_class_never_wraps_self_formatting_dunders(caplog):
+    for log_dunders, log_prvt_mthd in ((True, None), (False, True)):
+        class TestClass:
+            def __repr__(self):
+                return "TestClass()"
+
+            def __str__(self):
+                return "test"
+
+        instance = wrap_class(
+            TestClass,
+            log_init=False,
+            log_prvt_mthd=log_prvt_mthd,
+            log_dunders=log_dunders,
+        )()
+        with caplog.at_level(logging.DEBUG):
+            assert repr(instance) == "TestClass()", \
+                "a wrapped __repr__ would recurse through its own call record"
+            assert str(instance) == "test"
+        assert caplog.records == [], "__repr__ and __str__ should never be wrapped"
+
+def test_wrap_class_private_methods_cover_hot_dunders(caplog):
+    class TestClass:
+        def __eq__(self, other):
+            return True
+
+    instance = wrap_class(TestClass, log_init=False, log_prvt_mthd=True)()
+    with caplog.at_level(logging.DEBUG):
+        assert instance == 1
+    assert caplog.records[0].getMessage().startswith("Calling __eq__"), \
+        "log_prvt_mthd should wrap the hot dunders too"
+
+def test_wrap_function_no_arguments(caplog):
+    def test_func():
+        return "Hello, World!"
+
+    wrapped_func = wrap_function(test_func)
+    assert wrapped_func.__name__ == "test_func", "wrapped function should keep its name"
+    assert wrapped_func.__wrapped__ is test_func, "wrapped function should point at f"
+
+    with caplog.at_level(logging.DEBUG):
+        assert wrapped_func() == "Hello, World!"
+
+    assert caplog.records[0].getMessage() == "Calling test_func with () and {}"
+    assert caplog.records[1].getMessage() == "Returned Hello, World!"
+
+def test_wrap_function_no_arguments_given_arguments(caplog):
+    def test_func():
+        return "Hello, World!"
+
+    wrapped_func = wrap_function(test_func)
+
+    with caplog.at_level(logging.DEBUG):
+        with pytest.raises(TypeError, match="test_func"):
+            wrapped_func(1)  # type: ignore
+
+    assert caplog.records == [], \
+        "the zero argument wrapper rejects arguments before logging the call"
+
+def test_brace_message_formats_once():
+    calls = []
+
+    class Counted:
+        def __format__(self, spec):
+            calls.append(spec)
+            return "counted"
+
+    message = BraceMessage("{value}", {"value": Counted()})
+    assert str(message) == "counted"
+    assert str(message) == "counted"
+    assert len(calls) == 1, "BraceMessage should only format once"
+
+def test_wrap_function_gates_each_side(monkeypatch):
+    emitted = []
+    monkeypatch.setattr(
+        "goatl.helpers.get_emitter",
+        lambda lg, level, msg: lambda fields: emitted.append(level),
+    )
+
+    logger = logging.getLogger("test_wrap_function_sides")
+    logger.setLevel(logging.INFO)
+
+    wrapped_func = wrap_function(lambda x: x, logger)
+    wrapped_no_args = wrap_function(lambda: None, logger)
+
+    assert wrapped_func(1) == 1
+    assert wrapped_no_args() is None
+    assert emitted == [logging.INFO, logging.INFO], \
+        "only the enabled call side should be emitted"
+
+@pytest.mark.parametrize(
+    "msg, expected",
+    [
+        ("{funcName} called", "%(funcName)s called"),
+        ("Returned {result}", None),
+        ("{result!r} at 100%", "%(result)r at 100%%"),
+        ("{{literal}}", "{literal}"),
+        ("{args[0]}", None),
+        ("{result:>10}", None),
+        ("{}", None),
+        ("unbalanced }", None),
+    ],
+)
+def test_to_percent_style(msg, expected):
+    assert to_percent_style(msg) == expected
+
+
+def test_to_percent_style_safe_fields():
+    assert to_percent_style("Returned {result}", frozenset({"result"})) \
+        == "Returned %(result)s"
+
+
+def test_wrap_function_custom_messages(caplog):
+    wrapped_func = wrap_function(
+        lambda x: x, call_msg="{funcName} at 100%", return_msg="got {result!r}"
+    )
+
+    with caplog.at_level(logging.DEBUG):
+        wrapped_func("a")
+
+    assert caplog.records[0].getMessage() == "<lambda> at 100%"
+    assert caplog.records[1].getMessage() == "got 'a'"
+
+def test_wrap_function_uses_result_format(caplog):
+    class Formatted:
+        def __format__(self, spec):
+            return "formatted"
+
+        def __str__(self):
+            return "str"
+
+    with caplog.at_level(logging.DEBUG):
+        wrap_function(lambda: Formatted(), return_msg="Got {result}")()
+        wrap_function(lambda: Formatted())()
+
+    assert caplog.records[1].getMessage() == "Got formatted", \
+        "a custom result template should be rendered with str.format semantics"
+    assert caplog.records[3].getMessage() == "Returned str", \
+        "the default result template should be rendered with %s"
+    assert caplog.records[3].msg == "Returned %(result)s", \
+        "the default result template should be handed to logging %-style"
+
+def test_wrap_function_percent_in_brace_template(caplog):
+    wrapped_func = wrap_function(
+        lambda: None, call_msg="rate is 100%(approx)", return_msg=None
+    )
+
+    with caplog.at_level(logging.DEBUG):
+        wrapped_func()
+
+    assert caplog.records[0].getMessage() == "rate is 100%(approx)", \
+        "templates without fields should be logged literally"
+
+def test_default_messages_are_brace_style():
+    assert DEFAULTS.CALL_MSG.format(funcName="f", args=(1,), kwargs={}) \
+        == "Calling f with (1,) and {}"
+    assert DEFAULTS.RETURN_MSG.format(result=2) == "Returned 2"
+
+def test_wrap_class_log_init_level(caplog):
+    class NoInit:
+        def method(self):
+            return "Hello, World!"
+
+    class WithInit:
+        def __init__(self):
+            pass
+
+        def __repr__(self):
+            return "WithInit()"
+
+    assert wrap_class(NoInit, log_init=logging.DEBUG)().method() == "Hello, World!"
+
+    wrapped_class = wrap_class(WithInit, log_init=logging.WARNING)
+    with caplog.at_level(logging.DEBUG):
+        wrapped_class()
+
+    assert caplog.records[0].getMessage() == "Initialized WithInit()"
+    assert caplog.records[0].levelno == logging.WARNING, \
+        "an int log_init should be used as the init level"
+
+def test_wrap_class_nothing_to_log():
+    class TestClass:
+        def __init__(self):
+            pass
+
+        def method(self):
+            return "Hello, World!"
+
+    init, method = TestClass.__init__, TestClass.method
+
+    wrapped_class = wrap_class(TestClass, log_init=False, log_methods=False)
+    assert wrapped_class is TestClass
+    assert wrapped_class.__init__ is init, "__init__ should be left as is"
+    assert wrapped_class.method is method, "methods should be left as is"